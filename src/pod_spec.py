@@ -58,42 +58,30 @@ def _validate_data(config_data: Dict[str, Any], relation_data: Dict[str, Any]) -
     Raises:
         ValueError: when config and/or relation data is not valid.
     """
-    config_validators = {
-        "site_url": lambda value, _: isinstance(value, str)
-        if value is not None
-        else True,
-        "cluster_issuer": lambda value, _: isinstance(value, str)
-        if value is not None
-        else True,
-        "ingress_whitelist_source_range": lambda value, _: _validate_ip_network(value),
-        "tls_secret_name": lambda value, _: isinstance(value, str)
-        if value is not None
-        else True,
-    }
-    relation_validators = {
-        "mysql_host": lambda value, _: isinstance(value, str) and len(value) > 0,
-        "mysql_port": lambda value, _: isinstance(value, str) and int(value) > 0,
-        "mysql_user": lambda value, _: isinstance(value, str) and len(value) > 0,
-        "mysql_password": lambda value, _: isinstance(value, str) and len(value) > 0,
-        "mysql_root_password": lambda value, _: isinstance(value, str)
-        and len(value) > 0,
-    }
     problems = []
 
-    for key, validator in config_validators.items():
-        valid = validator(config_data.get(key), config_data)
-
-        if not valid:
+    for key in ("site_url", "cluster_issuer", "tls_secret_name"):
+        value = config_data.get(key)
+        if value is not None and not isinstance(value, str):
             problems.append(key)
 
-    for key, validator in relation_validators.items():
-        valid = validator(relation_data.get(key), relation_data)
+    if not _validate_ip_network(config_data.get("ingress_whitelist_source_range")):
+        problems.append("ingress_whitelist_source_range")
 
-        if not valid:
+    for key in ("mysql_host", "mysql_user", "mysql_password", "mysql_root_password"):
+        value = relation_data.get(key)
+        if not (isinstance(value, str) and value):
             problems.append(key)
 
+    mysql_port = relation_data.get("mysql_port")
+    try:
+        if not (isinstance(mysql_port, str) and int(mysql_port) > 0):
+            problems.append("mysql_port")
+    except ValueError:
+        problems.append("mysql_port")
+
     if len(problems) > 0:
-        raise ValueError("Errors found in: {}".format(", ".join(problems)))
+        raise ValueError(f"Errors found in: {', '.join(problems)}")
 
     return True
 
@@ -122,10 +110,11 @@ def _make_pod_envconfig(
     Returns:
         Dict[str, Any]: pod environment configuration.
     """
+    mysql_root_password = relation_state["mysql_root_password"]
+    mysql_host = relation_state["mysql_host"]
+    mysql_port = relation_state["mysql_port"]
     envconfig = {
-        "DATA_SOURCE_NAME": "root:{mysql_root_password}@({mysql_host}:{mysql_port})/".format(
-            **relation_state
-        )
+        "DATA_SOURCE_NAME": f"root:{mysql_root_password}@({mysql_host}:{mysql_port})/"
     }
 
     return envconfig
@@ -178,7 +167,7 @@ def _make_pod_ingress_resources(
         annotations["nginx.ingress.kubernetes.io/ssl-redirect"] = "false"
 
     ingress = {
-        "name": "{}-ingress".format(app_name),
+        "name": f"{app_name}-ingress",
         "annotations": annotations,
         "spec": {
             "rules": [
@@ -272,12 +261,6 @@ def make_pod_spec(
 
     _validate_data(config, relation_state)
 
-    ports = _make_pod_ports(port)
-    env_config = _make_pod_envconfig(config, relation_state)
-    readiness_probe = _make_readiness_probe(port)
-    liveness_probe = _make_liveness_probe(port)
-    ingress_resources = _make_pod_ingress_resources(config, app_name, port)
-
     return {
         "version": 3,
         "containers": [
@@ -285,15 +268,16 @@ def make_pod_spec(
                 "name": app_name,
                 "imageDetails": image_info,
                 "imagePullPolicy": "Always",
-                "ports": ports,
-                "envConfig": env_config,
+                "ports": _make_pod_ports(port),
+                "envConfig": _make_pod_envconfig(config, relation_state),
                 "kubernetes": {
-                    "readinessProbe": readiness_probe,
-                    "livenessProbe": liveness_probe,
+                    "readinessProbe": _make_readiness_probe(port),
+                    "livenessProbe": _make_liveness_probe(port),
                 },
             }
         ],
         "kubernetesResources": {
-            "ingressResources": ingress_resources or [],
+            "ingressResources": _make_pod_ingress_resources(config, app_name, port)
+            or [],
         },
     }
@@ -20,49 +20,104 @@
 # osm-charmers@lists.launchpad.net
 ##
 
+from types import MappingProxyType
 from typing import NoReturn
 import unittest
 
 import pod_spec
 
+_APP_NAME = "mysqld-exporter"
+_PORT = 9104
+_INGRESS_NAME = f"{_APP_NAME}-ingress"
+_RELATION_STATE = MappingProxyType(
+    {
+        "mysql_host": "mysql",
+        "mysql_port": "3306",
+        "mysql_user": "mano",
+        "mysql_password": "manopw",
+        "mysql_root_password": "rootpw",
+    }
+)
+_DATA_SOURCE_NAME = "root:{mysql_root_password}@({mysql_host}:{mysql_port})/".format(
+    **_RELATION_STATE
+)
+_IMAGE_INFO = {"upstream-source": "bitnami/mysqld-exporter:latest"}
+_INGRESS_RULE = {
+    "host": _APP_NAME,
+    "http": {
+        "paths": [
+            {
+                "path": "/",
+                "backend": {
+                    "serviceName": _APP_NAME,
+                    "servicePort": _PORT,
+                },
+            }
+        ]
+    },
+}
+
+_EXPECTED_CONTAINER = {
+    "name": _APP_NAME,
+    "imageDetails": _IMAGE_INFO,
+    "imagePullPolicy": "Always",
+    "ports": [
+        {
+            "name": _APP_NAME,
+            "containerPort": _PORT,
+            "protocol": "TCP",
+        }
+    ],
+    "envConfig": {"DATA_SOURCE_NAME": _DATA_SOURCE_NAME},
+    "kubernetes": {
+        "readinessProbe": {
+            "httpGet": {
+                "path": "/api/health",
+                "port": _PORT,
+            },
+            "initialDelaySeconds": 10,
+            "periodSeconds": 10,
+            "timeoutSeconds": 5,
+            "successThreshold": 1,
+            "failureThreshold": 3,
+        },
+        "livenessProbe": {
+            "httpGet": {
+                "path": "/api/health",
+                "port": _PORT,
+            },
+            "initialDelaySeconds": 60,
+            "timeoutSeconds": 30,
+            "failureThreshold": 10,
+        },
+    },
+}
+
 
 class TestPodSpec(unittest.TestCase):
     """Pod spec unit tests."""
 
     def test_make_pod_ports(self) -> NoReturn:
         """Testing make pod ports."""
-        port = 9104
-
         expected_result = [
             {
-                "name": "mysqld-exporter",
-                "containerPort": port,
+                "name": _APP_NAME,
+                "containerPort": _PORT,
                 "protocol": "TCP",
             }
         ]
 
-        pod_ports = pod_spec._make_pod_ports(port)
+        pod_ports = pod_spec._make_pod_ports(_PORT)
 
         self.assertListEqual(expected_result, pod_ports)
 
     def test_make_pod_envconfig(self) -> NoReturn:
         """Teting make pod envconfig."""
         config = {}
-        relation_state = {
-            "mysql_host": "mysql",
-            "mysql_port": "3306",
-            "mysql_user": "mano",
-            "mysql_password": "manopw",
-            "mysql_root_password": "rootpw",
-        }
 
-        expected_result = {
-            "DATA_SOURCE_NAME": "root:{mysql_root_password}@({mysql_host}:{mysql_port})/".format(
-                **relation_state
-            )
-        }
+        expected_result = {"DATA_SOURCE_NAME": _DATA_SOURCE_NAME}
 
-        pod_envconfig = pod_spec._make_pod_envconfig(config, relation_state)
+        pod_envconfig = pod_spec._make_pod_envconfig(config, _RELATION_STATE)
 
         self.assertDictEqual(expected_result, pod_envconfig)
 
@@ -72,200 +127,88 @@ class TestPodSpec(unittest.TestCase):
             "site_url": "",
             "cluster_issuer": "",
         }
-        app_name = "mysqld-exporter"
-        port = 9104
 
         pod_ingress_resources = pod_spec._make_pod_ingress_resources(
-            config, app_name, port
+            config, _APP_NAME, _PORT
         )
 
         self.assertIsNone(pod_ingress_resources)
 
     def test_make_pod_ingress_resources(self) -> NoReturn:
         """Testing make pod ingress resources."""
-        config = {
-            "site_url": "http://mysqld-exporter",
-            "cluster_issuer": "",
-            "ingress_whitelist_source_range": "",
-        }
-        app_name = "mysqld-exporter"
-        port = 9104
-
-        expected_result = [
-            {
-                "name": f"{app_name}-ingress",
-                "annotations": {
-                    "nginx.ingress.kubernetes.io/ssl-redirect": "false",
+        cases = (
+            (
+                "http",
+                {
+                    "site_url": "http://mysqld-exporter",
+                    "cluster_issuer": "",
+                    "ingress_whitelist_source_range": "",
                 },
-                "spec": {
-                    "rules": [
-                        {
-                            "host": app_name,
-                            "http": {
-                                "paths": [
-                                    {
-                                        "path": "/",
-                                        "backend": {
-                                            "serviceName": app_name,
-                                            "servicePort": port,
-                                        },
-                                    }
-                                ]
-                            },
-                        }
-                    ]
+                {"nginx.ingress.kubernetes.io/ssl-redirect": "false"},
+                None,
+            ),
+            (
+                "whitelist_source_range",
+                {
+                    "site_url": "http://mysqld-exporter",
+                    "cluster_issuer": "",
+                    "ingress_whitelist_source_range": "0.0.0.0/0",
                 },
-            }
-        ]
-
-        pod_ingress_resources = pod_spec._make_pod_ingress_resources(
-            config, app_name, port
-        )
-
-        self.assertListEqual(expected_result, pod_ingress_resources)
-
-    def test_make_pod_ingress_resources_with_whitelist_source_range(self) -> NoReturn:
-        """Testing make pod ingress resources with whitelist_source_range."""
-        config = {
-            "site_url": "http://mysqld-exporter",
-            "cluster_issuer": "",
-            "ingress_whitelist_source_range": "0.0.0.0/0",
-        }
-        app_name = "mysqld-exporter"
-        port = 9104
-
-        expected_result = [
-            {
-                "name": f"{app_name}-ingress",
-                "annotations": {
+                {
                     "nginx.ingress.kubernetes.io/ssl-redirect": "false",
-                    "nginx.ingress.kubernetes.io/whitelist-source-range": config[
-                        "ingress_whitelist_source_range"
-                    ],
+                    "nginx.ingress.kubernetes.io/whitelist-source-range": "0.0.0.0/0",
                 },
-                "spec": {
-                    "rules": [
-                        {
-                            "host": app_name,
-                            "http": {
-                                "paths": [
-                                    {
-                                        "path": "/",
-                                        "backend": {
-                                            "serviceName": app_name,
-                                            "servicePort": port,
-                                        },
-                                    }
-                                ]
-                            },
-                        }
-                    ]
+                None,
+            ),
+            (
+                "https",
+                {
+                    "site_url": "https://mysqld-exporter",
+                    "cluster_issuer": "",
+                    "ingress_whitelist_source_range": "",
+                    "tls_secret_name": "",
                 },
-            }
-        ]
-
-        pod_ingress_resources = pod_spec._make_pod_ingress_resources(
-            config, app_name, port
-        )
-
-        self.assertListEqual(expected_result, pod_ingress_resources)
-
-    def test_make_pod_ingress_resources_with_https(self) -> NoReturn:
-        """Testing make pod ingress resources with HTTPs."""
-        config = {
-            "site_url": "https://mysqld-exporter",
-            "cluster_issuer": "",
-            "ingress_whitelist_source_range": "",
-            "tls_secret_name": "",
-        }
-        app_name = "mysqld-exporter"
-        port = 9104
-
-        expected_result = [
-            {
-                "name": f"{app_name}-ingress",
-                "annotations": {},
-                "spec": {
-                    "rules": [
-                        {
-                            "host": app_name,
-                            "http": {
-                                "paths": [
-                                    {
-                                        "path": "/",
-                                        "backend": {
-                                            "serviceName": app_name,
-                                            "servicePort": port,
-                                        },
-                                    }
-                                ]
-                            },
-                        }
-                    ],
-                    "tls": [{"hosts": [app_name]}],
+                {},
+                [{"hosts": [_APP_NAME]}],
+            ),
+            (
+                "https_tls_secret_name",
+                {
+                    "site_url": "https://mysqld-exporter",
+                    "cluster_issuer": "",
+                    "ingress_whitelist_source_range": "",
+                    "tls_secret_name": "secret_name",
                 },
-            }
-        ]
-
-        pod_ingress_resources = pod_spec._make_pod_ingress_resources(
-            config, app_name, port
+                {},
+                [{"hosts": [_APP_NAME], "secretName": "secret_name"}],
+            ),
         )
 
-        self.assertListEqual(expected_result, pod_ingress_resources)
-
-    def test_make_pod_ingress_resources_with_https_tls_secret_name(self) -> NoReturn:
-        """Testing make pod ingress resources with HTTPs and TLS secret name."""
-        config = {
-            "site_url": "https://mysqld-exporter",
-            "cluster_issuer": "",
-            "ingress_whitelist_source_range": "",
-            "tls_secret_name": "secret_name",
-        }
-        app_name = "mysqld-exporter"
-        port = 9104
-
-        expected_result = [
-            {
-                "name": f"{app_name}-ingress",
-                "annotations": {},
-                "spec": {
-                    "rules": [
-                        {
-                            "host": app_name,
-                            "http": {
-                                "paths": [
-                                    {
-                                        "path": "/",
-                                        "backend": {
-                                            "serviceName": app_name,
-                                            "servicePort": port,
-                                        },
-                                    }
-                                ]
-                            },
-                        }
-                    ],
-                    "tls": [
-                        {"hosts": [app_name], "secretName": config["tls_secret_name"]}
-                    ],
-                },
-            }
-        ]
+        for name, config, annotations, tls in cases:
+            with self.subTest(name=name):
+                expected_spec = {"rules": [_INGRESS_RULE]}
+                if tls:
+                    expected_spec["tls"] = tls
+                expected_result = [
+                    {
+                        "name": _INGRESS_NAME,
+                        "annotations": annotations,
+                        "spec": expected_spec,
+                    }
+                ]
 
-        pod_ingress_resources = pod_spec._make_pod_ingress_resources(
-            config, app_name, port
-        )
+                pod_ingress_resources = pod_spec._make_pod_ingress_resources(
+                    config, _APP_NAME, _PORT
+                )
 
-        self.assertListEqual(expected_result, pod_ingress_resources)
+                self.assertListEqual(expected_result, pod_ingress_resources)
 
     def test_make_readiness_probe(self) -> NoReturn:
         """Testing make readiness probe."""
-        port = 9104
-
         expected_result = {
             "httpGet": {
                 "path": "/api/health",
-                "port": port,
+                "port": _PORT,
             },
             "initialDelaySeconds": 10,
             "periodSeconds": 10,
@@ -274,188 +217,71 @@ class TestPodSpec(unittest.TestCase):
             "failureThreshold": 3,
         }
 
-        readiness_probe = pod_spec._make_readiness_probe(port)
+        readiness_probe = pod_spec._make_readiness_probe(_PORT)
 
         self.assertDictEqual(expected_result, readiness_probe)
 
     def test_make_liveness_probe(self) -> NoReturn:
         """Testing make liveness probe."""
-        port = 9104
-
         expected_result = {
             "httpGet": {
                 "path": "/api/health",
-                "port": port,
+                "port": _PORT,
             },
             "initialDelaySeconds": 60,
             "timeoutSeconds": 30,
             "failureThreshold": 10,
         }
 
-        liveness_probe = pod_spec._make_liveness_probe(port)
+        liveness_probe = pod_spec._make_liveness_probe(_PORT)
 
         self.assertDictEqual(expected_result, liveness_probe)
 
     def test_make_pod_spec(self) -> NoReturn:
         """Testing make pod spec."""
-        image_info = {"upstream-source": "bitnami/mysqld-exporter:latest"}
         config = {
             "site_url": "",
             "cluster_issuer": "",
         }
-        relation_state = {
-            "mysql_host": "mysql",
-            "mysql_port": "3306",
-            "mysql_user": "mano",
-            "mysql_password": "manopw",
-            "mysql_root_password": "rootpw",
-        }
-        app_name = "mysqld-exporter"
-        port = 9104
 
         expected_result = {
             "version": 3,
-            "containers": [
-                {
-                    "name": app_name,
-                    "imageDetails": image_info,
-                    "imagePullPolicy": "Always",
-                    "ports": [
-                        {
-                            "name": app_name,
-                            "containerPort": port,
-                            "protocol": "TCP",
-                        }
-                    ],
-                    "envConfig": {
-                        "DATA_SOURCE_NAME": "root:{mysql_root_password}@({mysql_host}:{mysql_port})/".format(
-                            **relation_state
-                        )
-                    },
-                    "kubernetes": {
-                        "readinessProbe": {
-                            "httpGet": {
-                                "path": "/api/health",
-                                "port": port,
-                            },
-                            "initialDelaySeconds": 10,
-                            "periodSeconds": 10,
-                            "timeoutSeconds": 5,
-                            "successThreshold": 1,
-                            "failureThreshold": 3,
-                        },
-                        "livenessProbe": {
-                            "httpGet": {
-                                "path": "/api/health",
-                                "port": port,
-                            },
-                            "initialDelaySeconds": 60,
-                            "timeoutSeconds": 30,
-                            "failureThreshold": 10,
-                        },
-                    },
-                }
-            ],
+            "containers": [_EXPECTED_CONTAINER],
             "kubernetesResources": {"ingressResources": []},
         }
 
         spec = pod_spec.make_pod_spec(
-            image_info, config, relation_state, app_name, port
+            _IMAGE_INFO, config, _RELATION_STATE, _APP_NAME, _PORT
         )
 
         self.assertDictEqual(expected_result, spec)
 
     def test_make_pod_spec_with_ingress(self) -> NoReturn:
         """Testing make pod spec."""
-        image_info = {"upstream-source": "bitnami/mysqld-exporter:latest"}
         config = {
             "site_url": "https://mysqld-exporter",
             "cluster_issuer": "",
             "tls_secret_name": "mysqld-exporter",
             "ingress_whitelist_source_range": "0.0.0.0/0",
         }
-        relation_state = {
-            "mysql_host": "mysql",
-            "mysql_port": "3306",
-            "mysql_user": "mano",
-            "mysql_password": "manopw",
-            "mysql_root_password": "rootpw",
-        }
-        app_name = "mysqld-exporter"
-        port = 9104
 
         expected_result = {
             "version": 3,
-            "containers": [
-                {
-                    "name": app_name,
-                    "imageDetails": image_info,
-                    "imagePullPolicy": "Always",
-                    "ports": [
-                        {
-                            "name": app_name,
-                            "containerPort": port,
-                            "protocol": "TCP",
-                        }
-                    ],
-                    "envConfig": {
-                        "DATA_SOURCE_NAME": "root:{mysql_root_password}@({mysql_host}:{mysql_port})/".format(
-                            **relation_state
-                        )
-                    },
-                    "kubernetes": {
-                        "readinessProbe": {
-                            "httpGet": {
-                                "path": "/api/health",
-                                "port": port,
-                            },
-                            "initialDelaySeconds": 10,
-                            "periodSeconds": 10,
-                            "timeoutSeconds": 5,
-                            "successThreshold": 1,
-                            "failureThreshold": 3,
-                        },
-                        "livenessProbe": {
-                            "httpGet": {
-                                "path": "/api/health",
-                                "port": port,
-                            },
-                            "initialDelaySeconds": 60,
-                            "timeoutSeconds": 30,
-                            "failureThreshold": 10,
-                        },
-                    },
-                }
-            ],
+            "containers": [_EXPECTED_CONTAINER],
             "kubernetesResources": {
                 "ingressResources": [
                     {
-                        "name": "{}-ingress".format(app_name),
+                        "name": _INGRESS_NAME,
                         "annotations": {
                             "nginx.ingress.kubernetes.io/whitelist-source-range": config.get(
                                 "ingress_whitelist_source_range"
                             ),
                         },
                         "spec": {
-                            "rules": [
-                                {
-                                    "host": app_name,
-                                    "http": {
-                                        "paths": [
-                                            {
-                                                "path": "/",
-                                                "backend": {
-                                                    "serviceName": app_name,
-                                                    "servicePort": port,
-                                                },
-                                            }
-                                        ]
-                                    },
-                                }
-                            ],
+                            "rules": [_INGRESS_RULE],
                             "tls": [
                                 {
-                                    "hosts": [app_name],
+                                    "hosts": [_APP_NAME],
                                     "secretName": config.get("tls_secret_name"),
                                 }
                             ],
@@ -466,7 +292,7 @@ class TestPodSpec(unittest.TestCase):
         }
 
         spec = pod_spec.make_pod_spec(
-            image_info, config, relation_state, app_name, port
+            _IMAGE_INFO, config, _RELATION_STATE, _APP_NAME, _PORT
         )
 
         self.assertDictEqual(expected_result, spec)
@@ -485,28 +311,42 @@ class TestPodSpec(unittest.TestCase):
             "mysql_password": "manopw",
             "mysql_root_password": "rootpw",
         }
-        app_name = "mysqld-exporter"
-        port = 9104
 
         spec = pod_spec.make_pod_spec(
-            image_info, config, relation_state, app_name, port
+            image_info, config, relation_state, _APP_NAME, _PORT
         )
 
         self.assertIsNone(spec)
 
     def test_make_pod_spec_without_relation_state(self) -> NoReturn:
         """Testing make pod spec without relation_state."""
-        image_info = {"upstream-source": "bitnami/mysqld-exporter:latest"}
         config = {
             "site_url": "",
             "cluster_issuer": "",
         }
         relation_state = {}
-        app_name = "mysqld-exporter"
-        port = 9104
 
         with self.assertRaises(ValueError):
-            pod_spec.make_pod_spec(image_info, config, relation_state, app_name, port)
+            pod_spec.make_pod_spec(
+                _IMAGE_INFO, config, relation_state, _APP_NAME, _PORT
+            )
+
+    def test_make_pod_spec_with_invalid_whitelist_source_range(self) -> NoReturn:
+        """Testing make pod spec with invalid whitelist source ranges."""
+        for value in ("not-a-network", ["10.0.0.0/8"], {"cidr": "10.0.0.0/8"}):
+            with self.subTest(value=value):
+                config = {
+                    "site_url": "",
+                    "cluster_issuer": "",
+                    "ingress_whitelist_source_range": value,
+                }
+
+                with self.assertRaisesRegex(
+                    ValueError, "ingress_whitelist_source_range"
+                ):
+                    pod_spec.make_pod_spec(
+                        _IMAGE_INFO, config, _RELATION_STATE, _APP_NAME, _PORT
+                    )
 
 
 if __name__ == "__main__":